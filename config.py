@@ -10,6 +10,14 @@ you must replace these URLs with that provider’s official GTFS real-time feeds
 Author: Nwadilioramma Azuka-Onwuka
 """
 
+import os
+
+# Make sure protobuf uses its fast C-backed runtime ("upb", the default for
+# protobuf 4+) rather than the pure-Python fallback, which decodes GTFS-RT
+# feeds an order of magnitude slower. config is imported before any module
+# loads gtfs_realtime_pb2, so setting it here covers the whole app.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
 # Halifax Transit GTFS real-time alerts feed (e.g., service disruptions, detours)
 ALERT_FEED_URL = "http://gtfs.halifax.ca/realtime/Alert/Alerts.pb"
 
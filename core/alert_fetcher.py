@@ -6,19 +6,18 @@ Allows users to track specific routes, view affected stops, and read detailed al
 
 Dependencies:
 - google.transit.gtfs_realtime_pb2
-- requests
+- utils.http (shared HTTP session)
 - config (project configuration)
 - utils.time_converter (timestamp formatting)
-- geopy (for reverse geocoding stop locations, optional)
+- utils.geolocator (for reverse geocoding stop locations, optional)
 
 Author: Nwadilioramma Azuka-Onwuka
 """
 
-from google.transit import gtfs_realtime_pb2
-import requests
 import config
+from utils import geolocator
+from utils.http import get_session
 from utils.time_converter import convert_timestamp
-from geopy.geocoders import Nominatim
 
 
 class AlertFetcher:
@@ -30,20 +29,65 @@ class AlertFetcher:
 
     def __init__(self):
         """
-        Initialize AlertFetcher with a geolocator (for optional reverse geocoding).
+        Initialize AlertFetcher.
         """
-        self.geolocator = Nominatim(user_agent="transit_locator")
+        # Conditional-GET cache: validators from the last download plus the
+        # parsed feed, so an unchanged feed costs only a header round-trip.
+        self._etag = None
+        self._last_modified = None
+        self._parsed_feed = None
+        self._feed = None  # Reused FeedMessage, allocated on first fetch
+
+    def _fetch_feed(self):
+        """
+        Download and parse the alert feed, using a conditional GET.
+        If the server says the feed is unchanged (304), the previously
+        parsed feed is reused instead of downloading and parsing again.
+        Returns:
+            FeedMessage or None if the request failed.
+        """
+        # Imported here so starting the app (or using the static-data menu)
+        # does not pay for loading the protobuf bindings.
+        from google.transit import gtfs_realtime_pb2
+
+        # Ask for a compressed body; requests decompresses transparently.
+        headers = {"Accept-Encoding": "gzip, deflate"}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+
+        response = get_session().get(self.FEED_URL, headers=headers, timeout=10, stream=True)
+        if response.status_code == 304 and self._parsed_feed is not None:
+            response.close()
+            return self._parsed_feed
+        response.raise_for_status()
+
+        # Read straight from the buffered socket stream; response.content
+        # would first concatenate the whole body into an extra copy.
+        data = response.raw.read(decode_content=True)
+        # Reuse one FeedMessage across polls: clearing and merging into the
+        # existing message avoids re-allocating a fresh one every refresh.
+        if self._feed is None:
+            self._feed = gtfs_realtime_pb2.FeedMessage()
+        feed = self._feed
+        feed.Clear()
+        feed.MergeFromString(data)
+        # The app only reads a handful of fields; drop anything the
+        # bindings did not recognize instead of keeping it around.
+        feed.DiscardUnknownFields()
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
+        self._parsed_feed = feed
+        return feed
 
     def reverse_geocode(self, lat, lon):
         """
         Convert latitude and longitude into a human-readable address.
         Used for enriching stop information (optional).
+        Delegates to the shared, cached geolocator helper.
         """
-        try:
-            location = self.geolocator.reverse((lat, lon), timeout=10)
-            return location.address if location else "Unknown location"
-        except Exception:
-            return "(geocoding failed)"
+        return geolocator.reverse_geocode(lat, lon)
 
     def fetch_alerts(self):
         """
@@ -52,10 +96,7 @@ class AlertFetcher:
             A list of dictionaries containing alert details.
         """
         try:
-            response = requests.get(self.FEED_URL)
-            response.raise_for_status()
-            feed = gtfs_realtime_pb2.FeedMessage()
-            feed.ParseFromString(response.content)
+            feed = self._fetch_feed()
         except Exception as e:
             print(f"❌ Error fetching or parsing alerts: {e}")
             return []
@@ -106,41 +147,32 @@ Commands:
 """)
         user_routes = set() if tracked_routes is None else set(tracked_routes)
 
-        while True:
-            command = input("AlertFetcher >> ").strip().lower()
+        def cmd_all(arg):
+            nonlocal user_routes
+            user_routes = None
+            print("Type 'show' to display all alerts, or 'back' to cancel.")
 
-            if command == "all":
-                user_routes = None
-                print("Type 'show' to display all alerts, or 'back' to cancel.")
-
-            elif command.startswith("add "):
-                route = command[4:].strip().upper()
-                if route in user_routes:
-                    print(f"{route} is already in your tracked list.")
-                else:
-                    user_routes.add(route)
-                    print(f"{route} added to tracked routes (type 'show' to see alerts).")
-
-            elif command.startswith("remove "):
-                route = command[7:].strip().upper()
-                if route in user_routes:
-                    user_routes.remove(route)
-                    print(f"{route} removed from tracked routes.")
-                else:
-                    print(f"{route} is not in your tracked list.")
-
-            elif command == "show":
-                break
-
-            elif command == "list":
-                print("Tracked Routes:", ", ".join(user_routes) if user_routes else "(none)")
+        def cmd_add(arg):
+            route = arg.upper()
+            if route in user_routes:
+                print(f"{route} is already in your tracked list.")
+            else:
+                user_routes.add(route)
+                print(f"{route} added to tracked routes (type 'show' to see alerts).")
+
+        def cmd_remove(arg):
+            route = arg.upper()
+            if route in user_routes:
+                user_routes.remove(route)
+                print(f"{route} removed from tracked routes.")
+            else:
+                print(f"{route} is not in your tracked list.")
 
-            elif command == "back":
-                print("Returning to main menu.")
-                return
+        def cmd_list(arg):
+            print("Tracked Routes:", ", ".join(user_routes) if user_routes else "(none)")
 
-            elif command == "help":
-                print("""
+        def cmd_help(arg):
+            print("""
 Commands:
   add <ROUTE_ID>      → Track a route (e.g., add 10)
   remove <ROUTE_ID>   → Stop tracking a route
@@ -149,6 +181,30 @@ Commands:
   all                 → Show all alerts (ignore route filter)
   back                → Return to main menu
 """)
+
+        # Verb → handler table; one partition replaces the startswith chain
+        commands = {
+            "all": cmd_all,
+            "add": cmd_add,
+            "remove": cmd_remove,
+            "list": cmd_list,
+            "help": cmd_help,
+        }
+
+        while True:
+            command = input("AlertFetcher >> ").strip().lower()
+            cmd, _, arg = command.partition(" ")
+            arg = arg.strip()
+
+            if cmd == "show":
+                break
+            if cmd == "back":
+                print("Returning to main menu.")
+                return
+
+            handler = commands.get(cmd)
+            if handler:
+                handler(arg)
             else:
                 print("Invalid command. Type 'help' for available options.")
 
@@ -158,9 +214,12 @@ Commands:
             print("✅ No current alerts.")
             return
 
+        # Build the uppercase route filter once, not once per alert
+        upper_routes = None if user_routes is None else {r.upper() for r in user_routes}
+
         found = False
         for alert in alerts:
-            if user_routes is None or alert["routes"] & set(r.upper() for r in user_routes):
+            if upper_routes is None or alert["routes"] & upper_routes:
                 found = True
                 print("----- ALERT -----")
                 print("Header:", alert["header"])
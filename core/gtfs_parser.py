@@ -8,20 +8,31 @@ Parses static GTFS data from a zip file, providing access to:
 
 Dependencies:
 - csv (for reading GTFS text files)
+- io (for streaming decode of zipped text files)
 - zipfile (for accessing compressed GTFS data)
+- numpy (column-oriented stop coordinates)
 
 Author: Nwadilioramma Azuka-Onwuka
 """
 
 import csv
+import io
+import os
+import pickle
 import zipfile
 
+import numpy as np
+
 
 class GTFSParser:
     """
     A parser for reading GTFS static data files from a zip archive.
     """
 
+    # Bumped whenever the shape of the cached tables changes, so an old
+    # on-disk cache is reparsed instead of misread (v2: route keys upper).
+    _CACHE_VERSION = 2
+
     def __init__(self, zip_path):
         """
         Initialize the parser with the path to the GTFS zip file.
@@ -29,6 +40,76 @@ class GTFSParser:
             zip_path (str): Path to the GTFS .zip archive.
         """
         self.zip_path = zip_path
+        # One ZipFile handle, opened lazily and reused across every table
+        # parse, so the zip's central directory is only read once.
+        self._zip = None
+        # Lazily built lookup tables so trips.txt/stop_times.txt are only
+        # scanned once per run, no matter how many stops are queried.
+        self._stops = None
+        self._trip_to_route = None
+        self._stop_to_routes = None
+        self._route_to_stops = None
+        # Parsed tables are pickled next to the zip, so later runs skip
+        # the zip+CSV parse entirely unless the feed file was replaced.
+        self._cache_path = os.path.join(os.path.dirname(zip_path) or '.', '.gtfs_cache.pkl')
+        self._load_cache()
+
+    def _open_zip(self):
+        """
+        Get the shared ZipFile handle, opening it on first use.
+        """
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.zip_path, 'r')
+        return self._zip
+
+    def close(self):
+        """
+        Close the underlying zip handle, if one was opened.
+        """
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _load_cache(self):
+        """
+        Load previously parsed tables from the on-disk cache, if it is
+        at least as new as the GTFS zip itself.
+        """
+        try:
+            if os.path.getmtime(self._cache_path) < os.path.getmtime(self.zip_path):
+                return
+            with open(self._cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception:
+            return  # Missing or unreadable cache just means a fresh parse
+        if cached.get('version') != self._CACHE_VERSION:
+            return
+        self._stops = cached.get('stops')
+        self._trip_to_route = cached.get('trip_to_route')
+        self._stop_to_routes = cached.get('stop_to_routes')
+        self._route_to_stops = cached.get('route_to_stops')
+
+    def _save_cache(self):
+        """
+        Write the currently parsed tables to the on-disk cache.
+        """
+        try:
+            with open(self._cache_path, 'wb') as f:
+                pickle.dump({
+                    'version': self._CACHE_VERSION,
+                    'stops': self._stops,
+                    'trip_to_route': self._trip_to_route,
+                    'stop_to_routes': self._stop_to_routes,
+                    'route_to_stops': self._route_to_stops,
+                }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            pass  # A failed cache write should never break parsing
 
     def parse_stops(self):
         """
@@ -36,19 +117,52 @@ class GTFSParser:
         Returns:
             list of dicts: Each containing stop_id, stop_name, latitude, longitude.
         """
+        if self._stops is not None:
+            return self._stops
+
         stops = []
-        with zipfile.ZipFile(self.zip_path, 'r') as zip_ref:
-            with zip_ref.open('stops.txt') as file:
-                reader = csv.DictReader(file.read().decode('utf-8').splitlines())
-                for row in reader:
-                    stops.append({
-                        'stop_id': row['stop_id'],
-                        'stop_name': row['stop_name'],
-                        'lat': float(row['stop_lat']),
-                        'lon': float(row['stop_lon'])
-                    })
+        with self._open_zip().open('stops.txt') as file:
+            # Stream decompress+decode+parse together instead of
+            # materializing the whole file as one string first.
+            reader = csv.reader(io.TextIOWrapper(file, encoding='utf-8', newline=''))
+            # Resolve column positions once from the header so each row
+            # is indexed directly instead of built into a dict.
+            header = next(reader)
+            idx_id = header.index('stop_id')
+            idx_name = header.index('stop_name')
+            idx_lat = header.index('stop_lat')
+            idx_lon = header.index('stop_lon')
+            for row in reader:
+                stops.append({
+                    'stop_id': row[idx_id],
+                    'stop_name': row[idx_name],
+                    'lat': float(row[idx_lat]),
+                    'lon': float(row[idx_lon])
+                })
+
+        self._stops = stops
+        self._save_cache()
         return stops
 
+    def get_stop_arrays(self):
+        """
+        Get the stops as parallel column arrays instead of per-stop dicts.
+        The coordinate columns are float32 NumPy arrays, which keeps all
+        stops in a few compact blocks of memory and lets callers compute
+        distances over every stop in one vectorized expression.
+        Returns:
+            dict: 'stop_id' and 'stop_name' (object arrays),
+                  'lat' and 'lon' (float32 arrays), all aligned by index.
+        """
+        stops = self.parse_stops()
+        n = len(stops)
+        return {
+            'stop_id': np.array([s['stop_id'] for s in stops], dtype=object),
+            'stop_name': np.array([s['stop_name'] for s in stops], dtype=object),
+            'lat': np.fromiter((s['lat'] for s in stops), dtype=np.float32, count=n),
+            'lon': np.fromiter((s['lon'] for s in stops), dtype=np.float32, count=n),
+        }
+
     def get_routes_for_stop(self, stop_id):
         """
         Get all unique routes that serve a given stop.
@@ -57,20 +171,67 @@ class GTFSParser:
         Returns:
             list of route IDs (sorted).
         """
-        routes = set()
-        with zipfile.ZipFile(self.zip_path, 'r') as zip_ref:
-            # Build trip_id → route_id mapping
-            trips = csv.DictReader(zip_ref.open('trips.txt').read().decode('utf-8').splitlines())
-            trip_to_route = {row['trip_id']: row['route_id'] for row in trips}
+        if self._stop_to_routes is None:
+            self._build_route_index()
+        return sorted(self._stop_to_routes.get(stop_id, ()))
+
+    def get_stops_for_route(self, route_id):
+        """
+        Get the IDs of all stops served by a given route.
+        Args:
+            route_id (str): The ID of the route.
+        Returns:
+            set of stop IDs (empty if the route is unknown).
+        """
+        if self._route_to_stops is None:
+            self._build_route_index()
+        # The index stores route IDs uppercased, so matching any input
+        # case is a single dict lookup — no fallback scan over the keys.
+        return self._route_to_stops.get(route_id.upper(), set())
+
+    def _build_route_index(self):
+        """
+        Scan trips.txt and stop_times.txt once and build the
+        trip_id → route_id and stop_id → routes lookup tables.
+        All later stop queries are answered from these dicts.
+        """
+        zip_ref = self._open_zip()
+        # Build trip_id → route_id mapping
+        with zip_ref.open('trips.txt') as file:
+            trips = csv.reader(io.TextIOWrapper(file, encoding='utf-8', newline=''))
+            header = next(trips)
+            idx_trip = header.index('trip_id')
+            idx_route = header.index('route_id')
+            # Route IDs are uppercased here, once per trip, so lookups
+            # and feed comparisons never need a per-row .upper() again.
+            trip_to_route = {row[idx_trip]: row[idx_route].upper() for row in trips}
 
-            # Identify trips stopping at the specified stop_id
-            stop_times = csv.DictReader(zip_ref.open('stop_times.txt').read().decode('utf-8').splitlines())
+        # Group the routes serving each stop, and the stops served by
+        # each route, in the same single pass
+        stop_to_routes = {}
+        route_to_stops = {}
+        with zip_ref.open('stop_times.txt') as file:
+            stop_times = csv.reader(io.TextIOWrapper(file, encoding='utf-8', newline=''))
+            header = next(stop_times)
+            idx_trip = header.index('trip_id')
+            idx_stop = header.index('stop_id')
+            # stop_times.txt runs to millions of rows, so bind the dict
+            # methods once — the loop body then does no attribute
+            # lookups, only calls.
+            trip_route = trip_to_route.get
+            routes_at = stop_to_routes.setdefault
+            stops_on = route_to_stops.setdefault
             for row in stop_times:
-                if row['stop_id'] == stop_id:
-                    route = trip_to_route.get(row['trip_id'])
-                    if route:
-                        routes.add(route)
-        return sorted(routes)
+                route = trip_route(row[idx_trip])
+                if route:
+                    stop = row[idx_stop]
+                    routes_at(stop, set()).add(route)
+                    stops_on(route, set()).add(stop)
+
+        self._trip_to_route = trip_to_route
+        self._stop_to_routes = stop_to_routes
+        self._route_to_stops = route_to_stops
+        self._save_cache()
 
     def get_agency_info(self):
         """
@@ -79,15 +240,23 @@ class GTFSParser:
             list of dicts: Each containing agency name, URL, timezone, language, and phone number.
         """
         agencies = []
-        with zipfile.ZipFile(self.zip_path, 'r') as zip_ref:
-            with zip_ref.open('agency.txt') as file:
-                reader = csv.DictReader(file.read().decode('utf-8').splitlines())
-                for row in reader:
-                    agencies.append({
-                        'Agency Name': row.get('agency_name'),
-                        'Agency URL': row.get('agency_url'),
-                        'Timezone': row.get('agency_timezone'),
-                        'Agency Language': row.get('agency_lang'),
-                        'Agency Phone Number': row.get('agency_phone')
-                    })
+        with self._open_zip().open('agency.txt') as file:
+            reader = csv.reader(io.TextIOWrapper(file, encoding='utf-8', newline=''))
+            # Agency columns are optional, so map names to positions and
+            # tolerate any that are missing from this feed.
+            header = next(reader)
+            columns = {name: i for i, name in enumerate(header)}
+
+            def field(row, name):
+                i = columns.get(name)
+                return row[i] if i is not None and i < len(row) else None
+
+            for row in reader:
+                agencies.append({
+                    'Agency Name': field(row, 'agency_name'),
+                    'Agency URL': field(row, 'agency_url'),
+                    'Timezone': field(row, 'agency_timezone'),
+                    'Agency Language': field(row, 'agency_lang'),
+                    'Agency Phone Number': field(row, 'agency_phone')
+                })
         return agencies
@@ -7,8 +7,8 @@ and explore routes at a stop.
 
 Dependencies:
 - google.transit.gtfs_realtime_pb2
-- requests
-- geopy (reverse geocoding)
+- utils.http (shared HTTP session)
+- utils.geolocator (reverse geocoding)
 - core.gtfs_parser (for static route/stop lookups)
 - utils.stop_finder (for interactive stop finding)
 - utils.time_converter (timestamp conversion)
@@ -16,12 +16,15 @@ Dependencies:
 Author: Nwadilioramma Azuka-Onwuka
 """
 
-from google.transit import gtfs_realtime_pb2
-import requests
+import heapq
+import time
+from operator import itemgetter
+
 import config
+from utils import geolocator
+from utils.http import get_session
 from utils.stop_finder import StopFinder
 from utils.time_converter import convert_timestamp
-from geopy.geocoders import Nominatim
 from core.gtfs_parser import GTFSParser  # Needed for route lookup
 
 
@@ -32,12 +35,97 @@ class TripUpdater:
     """
 
     FEED_URL = config.TRIPS_FEED_URL  # URL to the live trip updates feed
+    FEED_TTL = 15  # Seconds a fetched feed stays fresh for repeated queries
+    MAX_ARRIVALS = 10  # How many upcoming arrivals to show per query
+
+    def __init__(self, parser=None):
+        """
+        Initialize the TripUpdater.
+        Args:
+            parser (GTFSParser): Shared static-data parser. One is created
+                if the caller does not supply it.
+        """
+        self.parser = parser if parser is not None else GTFSParser("data/Static_data.zip")
+        # Conditional-GET cache: validators from the last download plus the
+        # parsed feed, so an unchanged feed costs only a header round-trip.
+        self._etag = None
+        self._last_modified = None
+        self._parsed_feed = None
+        self._feed = None  # Reused FeedMessage, allocated on first fetch
+        # stop_id → list of stop-time updates, rebuilt when the feed is
+        # refetched; lets repeated queries for the same stop skip the
+        # full entity scan (and, within the TTL, the network round-trip).
+        self._stop_index = None
+        self._feed_fetched_at = 0.0
+
+    def _fetch_feed(self):
+        """
+        Download and parse the trip update feed, using a conditional GET.
+        If the server says the feed is unchanged (304), the previously
+        parsed feed is reused instead of downloading and parsing again.
+        Returns:
+            FeedMessage or None if the request failed.
+        """
+        # Imported here so starting the app (or using the static-data menu)
+        # does not pay for loading the protobuf bindings.
+        from google.transit import gtfs_realtime_pb2
+
+        # Ask for a compressed body; requests decompresses transparently.
+        headers = {"Accept-Encoding": "gzip, deflate"}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+
+        response = get_session().get(self.FEED_URL, headers=headers, timeout=10, stream=True)
+        if response.status_code == 304 and self._parsed_feed is not None:
+            response.close()
+            return self._parsed_feed
+        response.raise_for_status()
 
-    def __init__(self):
+        # Read straight from the buffered socket stream; response.content
+        # would first concatenate the whole body into an extra copy.
+        data = response.raw.read(decode_content=True)
+        # Reuse one FeedMessage across polls: clearing and merging into the
+        # existing message avoids re-allocating a fresh one every refresh.
+        if self._feed is None:
+            self._feed = gtfs_realtime_pb2.FeedMessage()
+        feed = self._feed
+        feed.Clear()
+        feed.MergeFromString(data)
+        # The app only reads a handful of fields; drop anything the
+        # bindings did not recognize instead of keeping it around.
+        feed.DiscardUnknownFields()
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
+        self._parsed_feed = feed
+        return feed
+
+    @staticmethod
+    def _build_stop_index(feed):
         """
-        Initialize the TripUpdater with a geolocator for reverse geocoding.
+        Index every stop-time update in the feed by stop_id in one pass.
+        Args:
+            feed (FeedMessage): Parsed trip update feed.
+        Returns:
+            dict: stop_id → list of update dicts for that stop.
         """
-        self.geolocator = Nominatim(user_agent="halifax_transit_trip_updater")
+        stop_index = {}
+        for entity in feed.entity:
+            if entity.HasField("trip_update"):
+                trip = entity.trip_update
+                # Pull the route ID into a local once; each proto attribute
+                # access walks descriptor tables, so do not repeat it in
+                # the inner loop below.
+                trip_route = trip.trip.route_id
+                for stu in trip.stop_time_update:
+                    stop_index.setdefault(stu.stop_id, []).append({
+                        "route_id": trip_route,
+                        "stop_sequence": stu.stop_sequence,
+                        "arrival_time": stu.arrival.time,
+                        "departure_time": stu.departure.time
+                    })
+        return stop_index
 
     def reverse_geocode(self, lat, lon):
         """
@@ -48,11 +136,7 @@ class TripUpdater:
         Returns:
             str: Address or fallback text.
         """
-        try:
-            location = self.geolocator.reverse((lat, lon), timeout=10)
-            return location.address if location else "Unknown location"
-        except Exception:
-            return "(geocoding failed)"
+        return geolocator.reverse_geocode(lat, lon)
 
     def interactive_arrivals(self):
         """
@@ -72,60 +156,51 @@ Commands:
 """)
         stop_id = ""  # Currently selected stop ID
 
-        while True:
-            command = input("TripUpdater >> ").strip().lower()
-
-            if command.startswith("stop "):
-                # Set the stop ID (must be a 4-digit number)
-                candidate = command[5:].strip()
-                if candidate.isdigit() and len(candidate) == 4:
-                    stop_id = candidate
-                    print(f"Stop set to {stop_id}.")
-                else:
-                    print("Invalid stop ID. Must be a 4-digit number.\n")
+        def cmd_stop(arg):
+            # Set the stop ID (must be a 4-digit number)
+            nonlocal stop_id
+            if arg.isdigit() and len(arg) == 4:
+                stop_id = arg
+                print(f"Stop set to {stop_id}.")
+            else:
+                print("Invalid stop ID. Must be a 4-digit number.\n")
 
-            elif command.startswith("route "):
-                # Show arrivals for a specific route at the current stop
-                if not stop_id:
-                    print("Please enter a stop ID first (use: stop <STOP_ID>)\n")
-                else:
-                    route_id = command[6:].strip()
-                    self.get_arrivals(stop_id, route_id)
+        def cmd_route(arg):
+            # Show arrivals for a specific route at the current stop
+            if not stop_id:
+                print("Please enter a stop ID first (use: stop <STOP_ID>)\n")
+            else:
+                self.get_arrivals(stop_id, arg)
 
-            elif command == "routes":
-                # List all routes serving the current stop
-                if not stop_id:
-                    print("Please enter a stop ID first (use: stop <STOP_ID>)\n")
-                else:
-                    parser = GTFSParser("Static_data.zip")
-                    available_routes = parser.get_routes_for_stop(stop_id)
-                    if available_routes:
-                        print("Routes at stop:", ", ".join(available_routes))
-                    else:
-                        print("No routes found for that stop.\n")
-
-            elif command == "all":
-                # Show all arrivals at the current stop (ignore route filtering)
-                if not stop_id:
-                    print("Please enter a stop ID first (use: stop <STOP_ID>)\n")
+        def cmd_routes(arg):
+            # List all routes serving the current stop
+            if not stop_id:
+                print("Please enter a stop ID first (use: stop <STOP_ID>)\n")
+            else:
+                available_routes = self.parser.get_routes_for_stop(stop_id)
+                if available_routes:
+                    print("Routes at stop:", ", ".join(available_routes))
                 else:
-                    self.get_arrivals(stop_id, "all")
+                    print("No routes found for that stop.\n")
 
-            elif command == "clear":
-                stop_id = ""
-                print("Cleared stop ID. Use 'stop <STOP_ID>' to set a new one.\n")
+        def cmd_all(arg):
+            # Show all arrivals at the current stop (ignore route filtering)
+            if not stop_id:
+                print("Please enter a stop ID first (use: stop <STOP_ID>)\n")
+            else:
+                self.get_arrivals(stop_id, "all")
 
-            elif command == "back":
-                print("Returning to main menu.\n")
-                break
+        def cmd_clear(arg):
+            nonlocal stop_id
+            stop_id = ""
+            print("Cleared stop ID. Use 'stop <STOP_ID>' to set a new one.\n")
 
-            elif command == "find":
-                # Launch the StopFinder interactive menu
-                self.stop_finder_menu()
+        def cmd_find(arg):
+            # Launch the StopFinder interactive menu
+            self.stop_finder_menu()
 
-            elif command == "help":
-                # Show the help menu again
-                print("""
+        def cmd_help(arg):
+            print("""
 [Trip Updater Help]
 Commands:
   find               → Find stops
@@ -137,6 +212,30 @@ Commands:
   help               → Show this help message again
   back               → Return to the main menu
 """)
+
+        # Verb → handler table; one partition replaces the startswith chain
+        commands = {
+            "stop": cmd_stop,
+            "route": cmd_route,
+            "routes": cmd_routes,
+            "all": cmd_all,
+            "clear": cmd_clear,
+            "find": cmd_find,
+            "help": cmd_help,
+        }
+
+        while True:
+            command = input("TripUpdater >> ").strip().lower()
+            cmd, _, arg = command.partition(" ")
+            arg = arg.strip()
+
+            if cmd == "back":
+                print("Returning to main menu.\n")
+                break
+
+            handler = commands.get(cmd)
+            if handler:
+                handler(arg)
             else:
                 print("Invalid command. Type 'help' for options.\n")
 
@@ -147,30 +246,28 @@ Commands:
             stop_id (str): Stop ID to check.
             route_id (str): Route ID or 'all' to show all.
         """
-        try:
-            response = requests.get(self.FEED_URL)
-            response.raise_for_status()
-            feed = gtfs_realtime_pb2.FeedMessage()
-            feed.ParseFromString(response.content)
-        except Exception as e:
-            print(f"❌ Error fetching trip updates: {e}")
-            return
+        # Refresh the feed (and its stop index) only when the cached copy
+        # is older than the TTL; back-to-back queries reuse the index.
+        if self._stop_index is None or time.monotonic() - self._feed_fetched_at > self.FEED_TTL:
+            try:
+                feed = self._fetch_feed()
+            except Exception as e:
+                print(f"❌ Error fetching trip updates: {e}")
+                return
+            self._stop_index = self._build_stop_index(feed)
+            self._feed_fetched_at = time.monotonic()
 
-        trips = []
-        for entity in feed.entity:
-            if entity.HasField("trip_update"):
-                trip = entity.trip_update
-                if route_id == "all" or trip.trip.route_id.upper() == route_id.upper():
-                    for stu in trip.stop_time_update:
-                        if stu.stop_id == stop_id:
-                            trips.append({
-                                "route_id": trip.trip.route_id,
-                                "stop_sequence": stu.stop_sequence,
-                                "arrival_time": stu.arrival.time,
-                                "departure_time": stu.departure.time
-                            })
-
-        trips.sort(key=lambda x: x["arrival_time"])
+        if route_id == "all":
+            trips = list(self._stop_index.get(stop_id, ()))
+        else:
+            # Uppercase the requested route once, outside the filter
+            target_route = route_id.upper()
+            trips = [t for t in self._stop_index.get(stop_id, ())
+                     if t["route_id"].upper() == target_route]
+
+        # Only the next few arrivals are worth printing; selecting them is
+        # cheaper than fully sorting every update at the stop.
+        trips = heapq.nsmallest(self.MAX_ARRIVALS, trips, key=itemgetter("arrival_time"))
 
         if not trips:
             print("No upcoming arrivals for that stop and route.\n")
@@ -6,8 +6,8 @@ Allows users to interactively select routes to track and view live vehicle locat
 
 Dependencies:
 - config (project configuration)
-- requests
-- geopy (for reverse geocoding)
+- utils.http (shared HTTP session)
+- utils.geolocator (for reverse geocoding)
 - google.transit.gtfs_realtime_pb2 (protobuf decoding)
 - utils.time_converter (timestamp formatting)
 
@@ -15,9 +15,8 @@ Author: Nwadilioramma Azuka-Onwuka
 """
 
 import config
-import requests
-from geopy.geocoders import Nominatim
-from google.transit import gtfs_realtime_pb2
+from utils import geolocator
+from utils.http import get_session
 from utils.time_converter import convert_timestamp
 
 
@@ -30,10 +29,58 @@ class VehicleTracker:
 
     def __init__(self):
         """
-        Initialize the tracker with an empty route list and a geolocator.
+        Initialize the tracker with an empty route set.
         """
-        self.routes = []  # List of routes currently being tracked
-        self.geolocator = Nominatim(user_agent="halifax_transit_vehicle_locator")
+        self.routes = set()  # Routes currently being tracked
+        # Conditional-GET cache: validators from the last download plus the
+        # parsed feed, so an unchanged feed costs only a header round-trip.
+        self._etag = None
+        self._last_modified = None
+        self._parsed_feed = None
+        self._feed = None  # Reused FeedMessage, allocated on first fetch
+
+    def _fetch_feed(self):
+        """
+        Download and parse the vehicle position feed, using a conditional GET.
+        If the server says the feed is unchanged (304), the previously
+        parsed feed is reused instead of downloading and parsing again.
+        Returns:
+            FeedMessage or None if the request failed.
+        """
+        # Imported here so starting the app (or using the static-data menu)
+        # does not pay for loading the protobuf bindings.
+        from google.transit import gtfs_realtime_pb2
+
+        # Ask for a compressed body; requests decompresses transparently.
+        headers = {"Accept-Encoding": "gzip, deflate"}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+
+        response = get_session().get(self.FEED_URL, headers=headers, timeout=10, stream=True)
+        if response.status_code == 304 and self._parsed_feed is not None:
+            response.close()
+            return self._parsed_feed
+        response.raise_for_status()
+
+        # Read straight from the buffered socket stream; response.content
+        # would first concatenate the whole body into an extra copy.
+        data = response.raw.read(decode_content=True)
+        # Reuse one FeedMessage across polls: clearing and merging into the
+        # existing message avoids re-allocating a fresh one every refresh.
+        if self._feed is None:
+            self._feed = gtfs_realtime_pb2.FeedMessage()
+        feed = self._feed
+        feed.Clear()
+        feed.MergeFromString(data)
+        # The app only reads a handful of fields; drop anything the
+        # bindings did not recognize instead of keeping it around.
+        feed.DiscardUnknownFields()
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
+        self._parsed_feed = feed
+        return feed
 
     def reverse_geocode(self, lat, lon):
         """
@@ -44,11 +91,7 @@ class VehicleTracker:
         Returns:
             str: Resolved address or fallback string.
         """
-        try:
-            location = self.geolocator.reverse((lat, lon), timeout=10)
-            return location.address if location else "Unknown location"
-        except Exception:
-            return "(geocoding failed)"
+        return geolocator.reverse_geocode(lat, lon)
 
     def interactive_track(self):
         """
@@ -64,32 +107,30 @@ Commands:
   help             → Show this help message again
   back             → Return to the main menu
 """)
-        while True:
-            print("\n[Vehicle Tracker] Options: add <ROUTE>, remove <ROUTE>, show, routes, help, back")
-            user_input = input("Enter command >> ").strip().lower()
+        def cmd_add(arg):
+            route = arg.upper()
+            if route not in self.routes:
+                self.routes.add(route)
+                print(f"Added route {route}.")
+            else:
+                print(f"{route} is already being tracked.")
 
-            if user_input == "back":
-                break
-            elif user_input.startswith("add "):
-                route = user_input[4:].upper()
-                if route not in self.routes:
-                    self.routes.append(route)
-                    print(f"Added route {route}.")
-                else:
-                    print(f"{route} is already being tracked.")
-            elif user_input.startswith("remove "):
-                route = user_input[7:].upper()
-                if route in self.routes:
-                    self.routes.remove(route)
-                    print(f"Removed route {route}.")
-                else:
-                    print(f"{route} is not being tracked.")
-            elif user_input == "routes":
-                print("Tracking:", ", ".join(self.routes) or "None")
-            elif user_input == "show":
-                self.fetch()
-            elif user_input == "help":
-                print("""
+        def cmd_remove(arg):
+            route = arg.upper()
+            if route in self.routes:
+                self.routes.discard(route)
+                print(f"Removed route {route}.")
+            else:
+                print(f"{route} is not being tracked.")
+
+        def cmd_routes(arg):
+            print("Tracking:", ", ".join(sorted(self.routes)) or "None")
+
+        def cmd_show(arg):
+            self.fetch()
+
+        def cmd_help(arg):
+            print("""
 [Vehicle Tracker Help]
 Commands:
   add <ROUTE>      → Add a route to track (e.g., add 10)
@@ -99,6 +140,28 @@ Commands:
   help             → Show this help message again
   back             → Return to the main menu
 """)
+
+        # Verb → handler table; one partition replaces the startswith chain
+        commands = {
+            "add": cmd_add,
+            "remove": cmd_remove,
+            "routes": cmd_routes,
+            "show": cmd_show,
+            "help": cmd_help,
+        }
+
+        while True:
+            print("\n[Vehicle Tracker] Options: add <ROUTE>, remove <ROUTE>, show, routes, help, back")
+            user_input = input("Enter command >> ").strip().lower()
+            cmd, _, arg = user_input.partition(" ")
+            arg = arg.strip()
+
+            if cmd == "back":
+                break
+
+            handler = commands.get(cmd)
+            if handler:
+                handler(arg)
             else:
                 print("Invalid command. Type 'help' to see available options.")
 
@@ -107,27 +170,36 @@ Commands:
         Fetch and display real-time vehicle updates for the tracked routes.
         """
         try:
-            response = requests.get(self.FEED_URL)
-            response.raise_for_status()
-            feed = gtfs_realtime_pb2.FeedMessage()
-            feed.ParseFromString(response.content)
+            feed = self._fetch_feed()
         except Exception as e:
             print(f"Error fetching vehicle data: {e}")
             return
 
-        found = False
+        # First pass: scan the feed and collect the matching vehicles.
+        # Membership is checked against a set, not the route list. Tracked
+        # routes are stored uppercase, so uppercase the feed's route ID
+        # once per entity or buses on e.g. "1a" would silently be missed.
+        route_set = {r.upper() for r in self.routes}
+        matches = []
         for entity in feed.entity:
             if entity.HasField("vehicle"):
                 v = entity.vehicle
-                if v.trip.route_id in self.routes:
-                    found = True
-                    print(f"\n--- Vehicle Update ---")
-                    lat = v.position.latitude
-                    lon = v.position.longitude
-                    place = self.reverse_geocode(lat, lon)
-                    print(f"Route: {v.trip.route_id}")
-                    print(f"Location: {place} (Lat: {lat:.4f}, Lon: {lon:.4f})")
-                    print(f"Timestamp: {convert_timestamp(v.timestamp)}")
-
-        if not found:
+                route = v.trip.route_id.upper()
+                if route in route_set:
+                    matches.append((route,
+                                    v.position.latitude,
+                                    v.position.longitude,
+                                    v.timestamp))
+
+        if not matches:
             print("No vehicles found on the tracked routes.")
+            return
+
+        # Second pass: geocode and print, so one slow lookup no longer
+        # stalls the scan over the rest of the feed.
+        for route_id, lat, lon, timestamp in matches:
+            print(f"\n--- Vehicle Update ---")
+            place = self.reverse_geocode(lat, lon)
+            print(f"Route: {route_id}")
+            print(f"Location: {place} (Lat: {lat:.4f}, Lon: {lon:.4f})")
+            print(f"Timestamp: {convert_timestamp(timestamp)}")
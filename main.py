@@ -12,10 +12,10 @@ It provides an interactive console interface to:
 Author: Nwadilioramma Azuka-Onwuka
 """
 
+# The fetcher classes are imported inside the menu branches below: they
+# pull in protobuf and geopy, which is wasted startup time for someone
+# who only wants the static-data options.
 from core.gtfs_parser import GTFSParser
-from core.trip_updater import TripUpdater
-from core.alert_fetcher import AlertFetcher
-from core.vehicle_tracker import VehicleTracker
 from utils.route_manager import manage_routes
 from utils.io import prompt_route_selection, quit_check
 
@@ -49,13 +49,13 @@ H - Help
 Q - Quit the application
 """)
 
-    # Setup GTFS data parser and core modules
+    # Setup the GTFS data parser; the feed fetchers are created on first use
     gtfs_path = "data/Static_data.zip"
     parser = GTFSParser(gtfs_path)
-    alert_fetcher = AlertFetcher()
-    trip_updater = TripUpdater()
-    vehicle_tracker = VehicleTracker()
-    tracked_routes = []  # User’s currently tracked routes
+    alert_fetcher = None
+    trip_updater = None
+    vehicle_tracker = None
+    tracked_routes = set()  # User’s currently tracked routes
 
     while True:
         # Main menu prompt
@@ -74,15 +74,24 @@ Q. Quit
 
         if choice == "1":
             print("You can choose which routes to see alerts for, or type 'all' to see everything.\n")
+            if alert_fetcher is None:
+                from core.alert_fetcher import AlertFetcher
+                alert_fetcher = AlertFetcher()
             alert_fetcher.display_alerts(tracked_routes)
 
         elif choice == "2":
             print("You can track buses by route and view live vehicle positions.")
+            if vehicle_tracker is None:
+                from core.vehicle_tracker import VehicleTracker
+                vehicle_tracker = VehicleTracker()
             vehicle_tracker.routes = tracked_routes
             vehicle_tracker.interactive_track()
 
         elif choice == "3":
             print("You can interactively check bus arrivals by stop ID and route.\n")
+            if trip_updater is None:
+                from core.trip_updater import TripUpdater
+                trip_updater = TripUpdater(parser)  # Share one parser (and its caches)
             trip_updater.interactive_arrivals()
 
         elif choice == "4":
@@ -1 +1,96 @@
-# TODO: Move all the geopy and geocoding stuff here in due time.
\ No newline at end of file
+"""
+Module: geolocator
+
+Shared reverse-geocoding helper for the whole app (AlertFetcher, TripUpdater,
+VehicleTracker all delegate here instead of each owning a Nominatim instance).
+
+Results are cached keyed by coordinates rounded to 4 decimal places (~10 m),
+because nearby vehicle positions resolve to the same address and Nominatim is
+rate-limited to about one request per second. The cache is persisted to
+~/.cache/areYouLate/geocode.pkl so lookups survive across runs.
+
+Author: Nwadilioramma Azuka-Onwuka
+"""
+
+import atexit
+import os
+import pickle
+
+from geopy.extra.rate_limiter import RateLimiter
+from geopy.geocoders import Nominatim
+
+# Where the geocode cache lives between runs
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "areYouLate")
+_CACHE_FILE = os.path.join(_CACHE_DIR, "geocode.pkl")
+
+_reverse = None  # Rate-limited reverse() wrapper, created on first use
+_cache = None  # (rounded lat, rounded lon) → address
+
+
+def _load_cache():
+    """
+    Load the persisted geocode cache from disk, or start empty.
+    Returns:
+        dict: The cache mapping rounded coordinates to addresses.
+    """
+    try:
+        with open(_CACHE_FILE, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return {}
+
+
+def _save_cache():
+    """
+    Write the geocode cache back to disk (registered to run at exit).
+    """
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(_CACHE_FILE, "wb") as f:
+            pickle.dump(_cache, f)
+    except Exception:
+        pass  # A failed cache save should never crash the app
+
+
+def reverse_geocode(lat, lon):
+    """
+    Convert latitude and longitude into a human-readable address.
+    Repeated lookups for the same ~10 m cell are answered from the cache
+    instead of hitting Nominatim again.
+    Args:
+        lat (float): Latitude.
+        lon (float): Longitude.
+    Returns:
+        str: Resolved address or fallback string.
+    """
+    global _reverse, _cache
+
+    if _cache is None:
+        _cache = _load_cache()
+        atexit.register(_save_cache)
+
+    key = (round(lat, 4), round(lon, 4))
+    if key in _cache:
+        return _cache[key]
+
+    if _reverse is None:
+        geolocator = Nominatim(user_agent="areYouLate_geocoder")
+        # Respect Nominatim's 1 request/second policy and retry with a
+        # pause instead of silently failing on a slow or busy server.
+        _reverse = RateLimiter(
+            geolocator.reverse,
+            min_delay_seconds=1.0,
+            max_retries=2,
+            error_wait_seconds=5.0,
+            swallow_exceptions=False,
+        )
+
+    try:
+        location = _reverse(key, timeout=15)
+        address = location.address if location else "Unknown location"
+    except Exception:
+        # Do not cache failures, so a later retry gets a fresh chance
+        return "(geocoding failed)"
+
+    _cache[key] = address
+    return address
@@ -0,0 +1,32 @@
+"""
+Module: http
+
+Provides a single shared requests.Session for all GTFS real-time feed downloads.
+
+Reusing one session keeps the TCP connection to the transit server alive between
+polls, so repeated fetches skip the connection handshake instead of paying for it
+on every refresh.
+
+Author: Nwadilioramma Azuka-Onwuka
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# One session shared by AlertFetcher, TripUpdater, and VehicleTracker.
+_session = requests.Session()
+_session.headers["User-Agent"] = "areYouLate-transit-assistant"
+
+# Pool a few keep-alive connections so every feed can reuse one.
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+
+def get_session():
+    """
+    Get the shared HTTP session used for all feed requests.
+    Returns:
+        requests.Session: The pooled, keep-alive session.
+    """
+    return _session
@@ -7,62 +7,72 @@ and managing the user's tracked bus routes.
 Author: Nwadilioramma Azuka-Onwuka
 """
 
-def manage_routes(tracked_routes):
-    """
-    Interactive route manager.
-    Allows the user to add, remove, or list tracked bus routes.
-    Args:
-        tracked_routes (list): A list of currently tracked route IDs.
-    """
-    print("""
+# One shared copy of the help text, shown on entry and for 'help' —
+# keeping it in one place also stops the two copies drifting apart.
+_HELP_TEXT = """
 ROUTE MANAGER COMMANDS:
   add <ROUTE>    → Add a bus route to your tracking list (e.g., add 10)
   remove <ROUTE> → Remove a bus route from your tracking list
   list           → View all tracked routes
   help           → Show this help menu
   back           → Return to main menu
-""")
+"""
+
+
+def manage_routes(tracked_routes):
+    """
+    Interactive route manager.
+    Allows the user to add, remove, or list tracked bus routes.
+    Args:
+        tracked_routes (set): The currently tracked route IDs.
+    """
+    print(_HELP_TEXT)
+
+    def cmd_add(arg):
+        # Add a route to the tracking list
+        route = arg.upper()
+        if route in tracked_routes:
+            print(f"{route} is already tracked.")
+        else:
+            tracked_routes.add(route)
+            print(f"Tracking {route}.")
+
+    def cmd_remove(arg):
+        # Remove a route from the tracking list
+        route = arg.upper()
+        if route in tracked_routes:
+            tracked_routes.discard(route)
+            print(f"Stopped tracking {route}.")
+        else:
+            print(f"{route} is not being tracked.")
+
+    def cmd_list(arg):
+        # Display all currently tracked routes
+        print("Currently tracking:", ", ".join(sorted(tracked_routes)) or "None")
+
+    def cmd_help(arg):
+        print(_HELP_TEXT)
+
+    # Verb → handler table; one partition replaces the startswith chain
+    commands = {
+        "add": cmd_add,
+        "remove": cmd_remove,
+        "list": cmd_list,
+        "help": cmd_help,
+    }
 
     while True:
         print("\nRoute Manager — Type: add <ROUTE>, remove <ROUTE>, list, back")
         command = input("Command: ").strip().lower()
+        cmd, _, arg = command.partition(" ")
+        arg = arg.strip()
 
-        if command == "back":
+        if cmd == "back":
             # Exit the route manager loop
             break
 
-        elif command.startswith("add "):
-            # Add a route to the tracking list
-            route = command[4:].strip().upper()
-            if route in tracked_routes:
-                print(f"{route} is already tracked.")
-            else:
-                tracked_routes.append(route)
-                print(f"Tracking {route}.")
-
-        elif command.startswith("remove "):
-            # Remove a route from the tracking list
-            route = command[7:].strip().upper()
-            if route in tracked_routes:
-                tracked_routes.remove(route)
-                print(f"Stopped tracking {route}.")
-            else:
-                print(f"{route} is not being tracked.")
-
-        elif command == "list":
-            # Display all currently tracked routes
-            print("Currently tracking:", ", ".join(tracked_routes) or "None")
-
-        elif command == "help":
-            # Show help menu
-            print("""
-ROUTE MANAGER COMMANDS:
-  add <ROUTE>    → Add a bus route to your tracking list (e.g., add 10)
-  remove <ROUTE> → Remove a bus route from your tracking list
-  list           → View all tracked routes
-  help           → Show this help menu
-  back           → Return to main menu
-""")
-
+        handler = commands.get(cmd)
+        if handler:
+            handler(arg)
         else:
             print("Invalid command. Type 'help' to see available commands.")
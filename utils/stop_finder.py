@@ -9,20 +9,36 @@ Provides tools to:
 Uses GTFS static data loaded from a .zip file.
 
 Dependencies:
-- zipfile (for reading compressed GTFS files)
-- csv (for parsing GTFS text files)
 - math (for haversine distance calculations)
-- core.gtfs_parser (to parse stops list)
+- numpy (vectorized distance sweeps over all stops)
+- core.gtfs_parser (stop list and route/stop indexes)
 
 Author: Nwadilioramma Azuka-Onwuka
 """
 
-import zipfile
-import csv
+import sys
 from math import radians, sin, cos, sqrt, atan2
+
+import numpy as np
+
 from core.gtfs_parser import GTFSParser
 
 
+def _haversine(lat1, lon1, lat2, lon2):
+    """
+    Great-circle distance between two points, in kilometers.
+    Module-level scalar implementation so hot call sites skip the
+    bound-method dispatch; the vectorized sweep in find_closest_stops
+    covers the many-stops case.
+    """
+    R = 6371  # Earth radius in km
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+    c = 2 * atan2(sqrt(a), sqrt(1 - a))
+    return R * c
+
+
 class StopFinder:
     """
     A class for searching and analyzing GTFS stops.
@@ -36,6 +52,45 @@ class StopFinder:
         """
         self.zip_path = zip_path
         self.parser = GTFSParser(zip_path)
+        self._load_stops()
+
+    def _load_stops(self):
+        """
+        Parse the stops once and build the cached lookup structures every
+        search method works from.
+        """
+        # The stop list itself, so no search re-parses the zip
+        self._stops = self.parser.parse_stops()
+        # Casefolded names, built once, so a name search does not re-fold
+        # every stop name on every query (casefold rather than lower, so
+        # accented or unusual-case names still match correctly)
+        self._stop_names_folded = [s['stop_name'].casefold() for s in self._stops]
+        # Memoized name-search results, keyed by casefolded keyword, so
+        # repeating a query (or refining a type-ahead prefix) skips the
+        # scan. Reset here so a refresh() cannot serve stale matches.
+        self._search_cache = {}
+        # Stop coordinates as parallel arrays, so every distance query runs
+        # as a few whole-array expressions instead of a Python loop per stop.
+        # The stops never move, so project them once onto a local tangent
+        # plane (km east/north around the feed's centre); ranking a query
+        # point is then just subtractions and multiply-adds on these arrays.
+        arrays = self.parser.get_stop_arrays()
+        lat_rad = np.radians(arrays['lat'])
+        lon_rad = np.radians(arrays['lon'])
+        self._cos_lat0 = cos(float(lat_rad.mean())) if lat_rad.size else 1.0
+        # Pin the projected coordinates to contiguous float32: 4 bytes per
+        # value is still ~1 cm of positional precision, and the distance
+        # sweep streams half the memory it would in float64.
+        self._proj_x = np.ascontiguousarray(lon_rad * (6371.0 * self._cos_lat0), dtype=np.float32)
+        self._proj_y = np.ascontiguousarray(lat_rad * 6371.0, dtype=np.float32)
+
+    def refresh(self):
+        """
+        Re-read the static data, for callers that replaced the GTFS zip
+        while the app is running.
+        """
+        self.parser = GTFSParser(self.zip_path)
+        self._load_stops()
 
     def haversine(self, lat1, lon1, lat2, lon2):
         """
@@ -46,12 +101,7 @@ class StopFinder:
         Returns:
             float: Distance in kilometers.
         """
-        R = 6371  # Earth radius in km
-        dlat = radians(lat2 - lat1)
-        dlon = radians(lon2 - lon1)
-        a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
-        c = 2 * atan2(sqrt(a), sqrt(1 - a))
-        return R * c
+        return _haversine(lat1, lon1, lat2, lon2)
 
     def find_stops_by_name(self, keyword):
         """
@@ -61,10 +111,15 @@ class StopFinder:
         Returns:
             list of dicts: Matching stops.
         """
-        matches = [s for s in self.parser.parse_stops() if keyword.lower() in s['stop_name'].lower()]
+        kw = keyword.casefold()
+        matches = self._search_cache.get(kw)
+        if matches is None:
+            matches = [self._stops[i] for i, name in enumerate(self._stop_names_folded) if kw in name]
+            self._search_cache[kw] = matches
         if matches:
-            for stop in matches:
-                print(f"{stop['stop_id']} → {stop['stop_name']}")
+            # One joined write instead of a print (and flush) per stop —
+            # broad searches can match hundreds of names.
+            sys.stdout.write("\n".join(f"{s['stop_id']} → {s['stop_name']}" for s in matches) + "\n")
         else:
             print("No stops found.")
         return matches
@@ -86,12 +141,38 @@ class StopFinder:
             print("Invalid latitude or longitude.")
             return []
 
-        stops = self.parser.parse_stops()
-        distances = [(s, self.haversine(lat, lon, s['lat'], s['lon'])) for s in stops]
-        closest = sorted(distances, key=lambda x: x[1])[:count]
+        stops = self._stops
+        count = min(count, len(stops))
+        if count == 0:
+            print("No stops found.")
+            return []
 
-        for stop, dist in closest:
-            print(f"{stop['stop_id']} → {stop['stop_name']} ({dist:.2f} km)")
+        # Rank stops by squared planar distance on the precomputed tangent-
+        # plane coordinates — no trig per stop, and only the query point
+        # itself needs projecting. Within city distances the approximation
+        # error is sub-meter, which cannot change the top-k ordering.
+        qx = radians(lon) * (6371.0 * self._cos_lat0)
+        qy = radians(lat) * 6371.0
+        dx = self._proj_x - qx
+        dy = self._proj_y - qy
+        d2 = dx * dx + dy * dy
+
+        # Partial selection of the top candidates, then the exact haversine
+        # distance only for those few, for accurate display. The common
+        # "nearest stop" case is a single linear reduction — no partition.
+        if count == 1:
+            idx = [int(d2.argmin())]
+        else:
+            idx = np.argpartition(d2, count - 1)[:count]
+        closest = sorted(
+            ((stops[i], _haversine(lat, lon, stops[i]['lat'], stops[i]['lon'])) for i in idx),
+            key=lambda pair: pair[1],
+        )
+
+        sys.stdout.write("\n".join(
+            f"{stop['stop_id']} → {stop['stop_name']} ({dist_km:.2f} km)"
+            for stop, dist_km in closest
+        ) + "\n")
         return closest
 
     def find_stops_for_route(self, route_id):
@@ -102,24 +183,14 @@ class StopFinder:
         Returns:
             list of stop dicts.
         """
-        stop_ids = set()
-
-        with zipfile.ZipFile(self.zip_path, 'r') as zip_ref:
-            # Build set of trip IDs associated with the route
-            trips = csv.DictReader(zip_ref.open('trips.txt').read().decode('utf-8').splitlines())
-            trip_ids = {row['trip_id'] for row in trips if row['route_id'].upper() == route_id.upper()}
-
-            # Collect all stop IDs from the selected trips
-            stop_times = csv.DictReader(zip_ref.open('stop_times.txt').read().decode('utf-8').splitlines())
-            for row in stop_times:
-                if row['trip_id'] in trip_ids:
-                    stop_ids.add(row['stop_id'])
+        # The parser indexes stops by route in one scan on first use (and
+        # persists it), so repeat queries are a dict lookup
+        stop_ids = self.parser.get_stops_for_route(route_id)
 
         # Filter the stop list to only those in stop_ids
-        stops = [s for s in self.parser.parse_stops() if s['stop_id'] in stop_ids]
+        stops = [s for s in self._stops if s['stop_id'] in stop_ids]
         if stops:
-            for stop in stops:
-                print(f"{stop['stop_id']} → {stop['stop_name']}")
+            sys.stdout.write("\n".join(f"{s['stop_id']} → {s['stop_name']}" for s in stops) + "\n")
         else:
             print("No stops found for that route.")
         return stops
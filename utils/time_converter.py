@@ -6,7 +6,25 @@ Provides a utility function to convert Unix timestamps into human-readable date
 Author: Nwadilioramma Azuka-Onwuka
 """
 
-import datetime
+import functools
+import time
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp(timestamp):
+    """
+    Format a whole-second Unix timestamp; results are cached because feed
+    entities (buses dwelling at a stop, shared alert periods) repeat the
+    same timestamps constantly.
+    """
+    # The format is fixed, so build it directly rather than paying for
+    # strftime's locale handling and format-string parsing on every call
+    t = time.localtime(timestamp)
+    ampm = 'AM' if t.tm_hour < 12 else 'PM'
+    hour12 = t.tm_hour % 12 or 12
+    return (f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} "
+            f"{hour12:02d}:{t.tm_min:02d}:{t.tm_sec:02d} {ampm}")
+
 
 def convert_timestamp(timestamp):
     """
@@ -16,4 +34,6 @@ def convert_timestamp(timestamp):
     Returns:
         str: The formatted date-time string (e.g., '2024-05-27 08:15:30 PM').
     """
-    return datetime.datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %I:%M:%S %p')
+    # Truncate to the second: sub-second precision is never rendered, and
+    # an int key lets repeated timestamps hit the cache.
+    return _format_timestamp(int(timestamp))